@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import datetime, timezone
+
+from russian_nato_transliterator import (
+    transliterate_auto,
+    transliterate_bgn_to_ru,
+    transliterate_ru_to_bgn,
+)
+
+# Word material for the synthetic corpora. It covers the context rules
+# (Е/Ё/Ю/Я at word start, after vowels and after Й/Ь/Ъ), the soft and hard
+# signs and the digraph letters.
+SURNAMES = [
+    "Ельцин", "Иванов", "Яковлев", "Юдин", "Щербаков", "Муравьёв", "Шевчук",
+    "Жуков", "Цветаева", "Чайковский", "Соловьёв", "Ерёменко", "Хрущёв",
+    "Зуев", "Объедков", "Гайдай", "Воронцова", "Кузьмин", "Ёлкин", "Тюрин",
+]
+GIVEN_NAMES = [
+    "Юрий", "Елена", "Яна", "Алексей", "Наталья", "Фёдор", "Ульяна", "Игорь",
+    "Евгений", "Мария", "Дмитрий", "Ксения", "Эдуард", "Ирина", "Сергей",
+]
+PATRONYMICS = [
+    "Юрьевич", "Алексеевна", "Фёдорович", "Игоревна", "Евгеньевич",
+    "Сергеевна", "Дмитриевич", "Эдуардовна", "Ильич", "Андреевна",
+]
+PLACES = [
+    "Тюмень", "Екатеринбург", "Ярославль", "Подъезд", "Щёлково", "Йошкар-Ола",
+    "Южно-Сахалинск", "Череповец", "Хабаровск", "Объячево", "Берёзовский",
+    "Ессентуки", "Елабуга", "Набережные Челны", "Красноярская область",
+]
+PROSE_WORDS = [
+    "съешь", "ещё", "этих", "мягких", "французских", "булок", "да", "выпей",
+    "чаю", "подъезд", "берёза", "ёлка", "объявление", "воробьи", "семья",
+    "южный", "ясный", "маяк", "поездка", "район", "заявление", "юбилей",
+    "шоссе", "щука", "жёлтый", "цепь", "чьи", "вьюга", "пьеса", "адъютант",
+    "и", "в", "на", "по", "из", "к", "о", "что", "это", "его", "её", "они",
+]
+
+DEFAULT_SIZES = "10000,100000,1000000"
+CORPUS_KINDS = ("names", "prose", "mixed")
+PARAGRAPH_CHARS = 2000
+
+
+def _sentence(rng: random.Random) -> str:
+    words = [rng.choice(PROSE_WORDS) for _ in range(rng.randint(6, 16))]
+    words[0] = words[0].capitalize()
+    return " ".join(words) + rng.choice([".", ".", ",", "!", "?"])
+
+
+def _name_record(rng: random.Random) -> str:
+    return (
+        f"{rng.choice(SURNAMES)} {rng.choice(GIVEN_NAMES)} "
+        f"{rng.choice(PATRONYMICS)}, {rng.choice(PLACES)}"
+    )
+
+
+def _prose_record(rng: random.Random) -> str:
+    parts: list[str] = []
+    size = 0
+    while size < PARAGRAPH_CHARS:
+        sentence = _sentence(rng)
+        parts.append(sentence)
+        size += len(sentence) + 1
+    return " ".join(parts)
+
+
+def _mixed_record(rng: random.Random) -> str:
+    # Russian prose with transliterated citations, as in a report that quotes
+    # names and places in BGN/PCGN form.
+    parts: list[str] = []
+    size = 0
+    while size < PARAGRAPH_CHARS:
+        if rng.random() < 0.4:
+            part = f"({transliterate_ru_to_bgn(_name_record(rng))})"
+        else:
+            part = _sentence(rng)
+        parts.append(part)
+        size += len(part) + 1
+    return " ".join(parts)
+
+
+def make_corpus(kind: str, size_chars: int, seed: int) -> list[str]:
+    """Return a list of records of the given kind totalling about size_chars."""
+    rng = random.Random(f"{kind}:{size_chars}:{seed}")
+    make_record = {
+        "names": _name_record,
+        "prose": _prose_record,
+        "mixed": _mixed_record,
+    }[kind]
+    records: list[str] = []
+    total = 0
+    while total < size_chars:
+        record = make_record(rng)
+        records.append(record)
+        total += len(record)
+    return records
+
+
+def _percentile(sorted_values: list[float], percent: float) -> float:
+    index = max(0, min(len(sorted_values) - 1, round(percent / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def measure(func: Callable[[str], str], records: list[str], repeat: int) -> dict[str, object]:
+    """Time func over all records and return throughput, latency and memory."""
+    func(records[0])
+
+    latencies: list[float] = []
+    total_ns = 0
+    for _ in range(repeat):
+        for record in records:
+            started = time.perf_counter_ns()
+            func(record)
+            elapsed = time.perf_counter_ns() - started
+            latencies.append(elapsed / 1000)
+            total_ns += elapsed
+    latencies.sort()
+    chars = sum(map(len, records)) * repeat
+
+    # tracemalloc slows every allocation down, so memory is measured in a
+    # separate pass. Results are dropped, so the peak is the largest working
+    # set of a single call.
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    for record in records:
+        func(record)
+    peak = tracemalloc.get_traced_memory()[1] - baseline
+    tracemalloc.stop()
+
+    return {
+        "records": len(records),
+        "chars": chars // repeat,
+        "chars_per_sec": round(chars / (total_ns / 1e9)) if total_ns else None,
+        "latency_us": {
+            "p50": round(_percentile(latencies, 50), 2),
+            "p90": round(_percentile(latencies, 90), 2),
+            "p99": round(_percentile(latencies, 99), 2),
+            "max": round(latencies[-1], 2),
+        },
+        "peak_memory_bytes": peak,
+    }
+
+
+def _ru2lat_ascii(text: str) -> str:
+    return transliterate_ru_to_bgn(text, ascii_only=True)
+
+
+def _auto_ascii(text: str) -> str:
+    return transliterate_auto(text, ascii_only=True)
+
+
+def _cases(
+    kind: str, source: list[str]
+) -> list[tuple[str, str, bool, list[str], Callable[[str], str]]]:
+    """Return (direction, input, ascii_only, records, func) for one corpus."""
+    if kind == "mixed":
+        # Mixed records already contain both scripts, so each direction runs
+        # once per ascii_only setting on the records themselves.
+        return [
+            ("ru2lat", "mixed", False, source, transliterate_ru_to_bgn),
+            ("ru2lat", "mixed", True, source, _ru2lat_ascii),
+            ("lat2ru", "mixed", False, source, transliterate_bgn_to_ru),
+            ("auto", "mixed", False, source, transliterate_auto),
+            ("auto", "mixed", True, source, _auto_ascii),
+        ]
+    # For lat2ru, ascii_only names the Latin variant of the input: with ë or
+    # with ASCII yo.
+    latin = [transliterate_ru_to_bgn(record) for record in source]
+    latin_ascii = [_ru2lat_ascii(record) for record in source]
+    return [
+        ("ru2lat", "cyrillic", False, source, transliterate_ru_to_bgn),
+        ("ru2lat", "cyrillic", True, source, _ru2lat_ascii),
+        ("lat2ru", "latin", False, latin, transliterate_bgn_to_ru),
+        ("lat2ru", "latin", True, latin_ascii, transliterate_bgn_to_ru),
+        ("auto", "cyrillic", False, source, transliterate_auto),
+        ("auto", "cyrillic", True, source, _auto_ascii),
+        ("auto", "latin", False, latin, transliterate_auto),
+    ]
+
+
+def run_benchmarks(
+    kinds: list[str], sizes: list[int], repeat: int, seed: int
+) -> list[dict[str, object]]:
+    results: list[dict[str, object]] = []
+    for kind in kinds:
+        for size in sizes:
+            source = make_corpus(kind, size, seed)
+            for direction, script, ascii_only, records, func in _cases(kind, source):
+                result: dict[str, object] = {
+                    "corpus": kind,
+                    "size_chars": size,
+                    "input": script,
+                    "direction": direction,
+                    "ascii_only": ascii_only,
+                }
+                result.update(measure(func, records, repeat))
+                results.append(result)
+    return results
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Benchmark the Russian <-> BGN/PCGN transliteration functions offline."
+    )
+    parser.add_argument(
+        "--sizes",
+        default=DEFAULT_SIZES,
+        help=f"comma-separated corpus sizes in characters (default: {DEFAULT_SIZES})",
+    )
+    parser.add_argument(
+        "--kinds",
+        default=",".join(CORPUS_KINDS),
+        help="comma-separated corpus kinds: names, prose, mixed (default: all)",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="timed passes per case (default: 3)")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the synthetic corpora")
+    parser.add_argument("--output-file", help="write the JSON report here instead of stdout")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    kinds = [kind.strip() for kind in args.kinds.split(",") if kind.strip()]
+    unknown = sorted(set(kinds) - set(CORPUS_KINDS))
+    if unknown:
+        print(f"Unknown corpus kind: {', '.join(unknown)}", file=sys.stderr)
+        return 2
+    if args.repeat < 1 or any(size < 1 for size in sizes):
+        print("--repeat and --sizes must be positive", file=sys.stderr)
+        return 2
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "repeat": args.repeat,
+        },
+        "results": run_benchmarks(kinds, sizes, args.repeat, args.seed),
+    }
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output_file:
+        with open(args.output_file, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
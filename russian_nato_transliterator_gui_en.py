@@ -1,7 +1,13 @@
 #!/usr/bin/env python3
+import codecs
+import os
+import threading
+import time
 import tkinter as tk
 import tkinter.font as tkfont
+from collections.abc import Callable, Iterator
 from tkinter import filedialog, messagebox, ttk
+from typing import TextIO
 
 from russian_nato_transliterator import (
     transliterate_auto,
@@ -9,6 +15,75 @@ from russian_nato_transliterator import (
     transliterate_ru_to_bgn,
 )
 
+# Live mode converts changes up to this many characters directly on the Tk
+# main loop; larger ones (pastes, the first pass, option changes) go to a
+# background thread. Its per-line cache is bounded by total characters.
+LIVE_INLINE_CHARS = 64 * 1024
+LIVE_CACHE_MAX_CHARS = 4 * 1024 * 1024
+
+# Loading a file larger than this switches live mode off: re-reading and
+# comparing the whole input on every keystroke would freeze the window.
+LIVE_MAX_FILE_BYTES = 4 * 1024 * 1024
+
+# If loading a file fails, the previous input is put back only when it was at
+# most this long; larger inputs are not copied aside and the input stays empty.
+LOAD_RESTORE_MAX_CHARS = 1024 * 1024
+
+# Input is handed to the worker in blocks of whole lines so that progress can
+# be reported and cancellation is checked between blocks. Line breaks are word
+# boundaries, so splitting there does not change any context rule.
+WORKER_BLOCK_CHARS = 64 * 1024
+
+# Files are read, inserted and written in pieces of this many characters so
+# that large files neither block the UI in one call nor exist twice in memory.
+FILE_CHUNK_CHARS = 1024 * 1024
+
+# A line running longer than this many chunks is cut after its last space or
+# tab, which is a word boundary. A run without whitespace is never cut, since
+# a block starting mid-word would change the context rules; it is held until
+# whitespace or a line break follows.
+MAX_LINE_CHUNKS = 8
+
+# File-to-file conversion only shows this many bytes of the input and the
+# result in the text areas.
+PREVIEW_BYTES = 4 * 1024
+
+
+def _after_last_space(text: str) -> int:
+    return max(text.rfind(" "), text.rfind("\t")) + 1
+
+
+def iter_line_blocks(stream: TextIO, block_chars: int = FILE_CHUNK_CHARS) -> Iterator[str]:
+    """Yield the stream in blocks of roughly block_chars that end at a line break."""
+    # Pieces of the unfinished last line; only each new chunk is searched.
+    # split_at is the last piece containing whitespace and the offset after it.
+    pending: list[str] = []
+    pending_chars = 0
+    split_at: tuple[int, int] | None = None
+    while chunk := stream.read(block_chars):
+        cut = chunk.rfind("\n") + 1
+        if cut:
+            pending.append(chunk[:cut])
+            yield "".join(pending)
+            pending = [chunk[cut:]]
+            pending_chars = len(chunk) - cut
+            offset = _after_last_space(pending[0])
+            split_at = (0, offset) if offset else None
+            continue
+        pending.append(chunk)
+        pending_chars += len(chunk)
+        offset = _after_last_space(chunk)
+        if offset:
+            split_at = (len(pending) - 1, offset)
+        if pending_chars >= block_chars * MAX_LINE_CHUNKS and split_at is not None:
+            index, offset = split_at
+            head = pending[index]
+            yield "".join(pending[:index]) + head[:offset]
+            pending = [head[offset:]] + pending[index + 1 :]
+            pending_chars = sum(map(len, pending))
+            split_at = None
+    if pending_chars:
+        yield "".join(pending)
 
 class RussianNatoTransliteratorGUIEn:
     def __init__(self, root: tk.Tk) -> None:
@@ -20,10 +95,26 @@ class RussianNatoTransliteratorGUIEn:
 
         self.direction_var = tk.StringVar(value="auto")
         self.ascii_var = tk.BooleanVar(value=False)
+        self.live_var = tk.BooleanVar(value=False)
         self.status_var = tk.StringVar(value="Ready")
         self.font_family_var = tk.StringVar(value="Arial")
         self.font_size_var = tk.IntVar(value=11)
 
+        self._worker: threading.Thread | None = None
+        self._cancel_event = threading.Event()
+        self._job_id = 0
+
+        # Live mode mirrors input_text line by line into output_text.
+        # _live_lines holds the input lines the output currently reflects and
+        # _live_options the (direction, ascii_only) they were converted with.
+        self._live_lines: list[str] = []
+        self._live_options: tuple[str, bool] | None = None
+        self._live_cache: dict[tuple[str, str, bool], str] = {}
+        self._live_cache_chars = 0
+        self._live_thread: threading.Thread | None = None
+        self._live_generation = 0
+        self._live_pending = False
+
         self._build_ui()
         self._on_direction_changed()
         self._apply_fonts(update_status=False)
@@ -74,15 +165,26 @@ class RussianNatoTransliteratorGUIEn:
             controls,
             text="ASCII mode (yo instead of ë)",
             variable=self.ascii_var,
+            command=self._schedule_live_update,
         )
         self.ascii_check.grid(row=0, column=4, columnspan=2, sticky="w", padx=8, pady=6)
 
-        ttk.Button(controls, text="Transliterate", command=self._transliterate).grid(
-            row=0, column=6, sticky="e", padx=8, pady=6
+        self.transliterate_button = ttk.Button(
+            controls, text="Transliterate", command=self._transliterate
         )
+        self.transliterate_button.grid(row=0, column=6, sticky="e", padx=8, pady=6)
         ttk.Button(controls, text="Swap", command=self._swap_texts).grid(
             row=0, column=7, sticky="e", padx=8, pady=6
         )
+        self.cancel_button = ttk.Button(
+            controls, text="Cancel", command=self._cancel_transliteration
+        )
+        self.cancel_button.grid(row=0, column=8, sticky="e", padx=8, pady=6)
+        self.cancel_button.state(["disabled"])
+        self.convert_file_button = ttk.Button(
+            controls, text="Convert file…", command=self._convert_file
+        )
+        self.convert_file_button.grid(row=0, column=9, sticky="e", padx=8, pady=6)
 
         ttk.Label(controls, text="Font:").grid(row=1, column=0, sticky="w", padx=8, pady=6)
         font_values = self._font_families()
@@ -111,6 +213,12 @@ class RussianNatoTransliteratorGUIEn:
         ttk.Button(controls, text="Apply font", command=self._apply_fonts).grid(
             row=1, column=6, columnspan=2, sticky="w", padx=8, pady=6
         )
+        ttk.Checkbutton(
+            controls,
+            text="Live mode",
+            variable=self.live_var,
+            command=self._on_live_toggled,
+        ).grid(row=1, column=8, sticky="w", padx=8, pady=6)
 
         text_area = ttk.Frame(main)
         text_area.grid(row=2, column=0, sticky="nsew", pady=6)
@@ -136,6 +244,7 @@ class RussianNatoTransliteratorGUIEn:
 
         self.input_text = tk.Text(text_area, wrap="word", undo=True)
         self.input_text.grid(row=1, column=0, sticky="nsew", padx=(0, 6))
+        self.input_text.bind("<<Modified>>", self._on_input_modified)
 
         self.output_text = tk.Text(text_area, wrap="word", undo=False)
         self.output_text.grid(row=1, column=1, sticky="nsew", padx=(6, 0))
@@ -151,6 +260,8 @@ class RussianNatoTransliteratorGUIEn:
             row=0, column=1, padx=(0, 8)
         )
         ttk.Button(actions, text="Close", command=self.root.destroy).grid(row=0, column=2)
+        self.progress = ttk.Progressbar(actions, mode="determinate", maximum=100, length=160)
+        self.progress.grid(row=0, column=3, padx=(8, 0))
 
         ttk.Label(actions, text="(c) Developed by blyatberry").grid(
             row=0, column=9, sticky="w", padx=(8, 8)
@@ -199,13 +310,169 @@ class RussianNatoTransliteratorGUIEn:
         else:
             self.ascii_check.state(["disabled"])
             self.ascii_var.set(False)
+        self._schedule_live_update()
 
     def _get_input(self) -> str:
         return self.input_text.get("1.0", tk.END).rstrip("\n")
 
     def _set_output(self, text: str) -> None:
+        self.output_text.configure(state="normal")
         self.output_text.delete("1.0", tk.END)
         self.output_text.insert("1.0", text)
+        self._update_output_state()
+        # The output no longer mirrors the input line by line.
+        self._live_options = None
+
+    def _update_output_state(self) -> None:
+        # Live mode patches output_text by line number, so it must not be
+        # edited by hand while live mode is on.
+        self.output_text.configure(state="disabled" if self.live_var.get() else "normal")
+
+    def _on_input_modified(self, _event: object | None = None) -> None:
+        if not self.input_text.edit_modified():
+            return
+        # Resetting the flag fires <<Modified>> again; the check above skips it.
+        self.input_text.edit_modified(False)
+        self._live_generation += 1
+        self._schedule_live_update()
+
+    def _on_live_toggled(self) -> None:
+        self._update_output_state()
+        self._live_options = None
+        self._schedule_live_update()
+
+    def _schedule_live_update(self) -> None:
+        if not self.live_var.get() or self._live_pending:
+            return
+        self._live_pending = True
+        self.root.after_idle(self._live_update)
+
+    def _live_convert(self, line: str, direction: str, ascii_only: bool) -> str:
+        if not line:
+            return line
+        key = (line, direction, ascii_only)
+        converted = self._live_cache.get(key)
+        if converted is None:
+            converted = self._convert(line, direction, ascii_only)
+            size = len(line) + len(converted)
+            if self._live_cache_chars + size > LIVE_CACHE_MAX_CHARS:
+                self._live_cache.clear()
+                self._live_cache_chars = 0
+            self._live_cache[key] = converted
+            self._live_cache_chars += size
+        return converted
+
+    def _live_update(self) -> None:
+        self._live_pending = False
+        # While a large change is converted in the background, further edits
+        # are picked up once it has finished.
+        if not self.live_var.get() or self._live_thread is not None:
+            return
+
+        direction = self.direction_var.get()
+        ascii_only = bool(self.ascii_var.get())
+        options = (direction, ascii_only)
+        lines = self.input_text.get("1.0", "end-1c").split("\n")
+        old = self._live_lines if self._live_options == options else []
+
+        # Only the lines between the unchanged prefix and suffix are converted
+        # and patched into the output. In auto mode each line is detected on
+        # its own.
+        limit = min(len(old), len(lines))
+        start = 0
+        while start < limit and old[start] == lines[start]:
+            start += 1
+        suffix = 0
+        while suffix < limit - start and old[-1 - suffix] == lines[-1 - suffix]:
+            suffix += 1
+        changed = lines[start : len(lines) - suffix]
+        patch = (lines, start, len(old) - suffix, bool(suffix), options)
+
+        if sum(map(len, changed)) > LIVE_INLINE_CHARS:
+            self._live_thread = threading.Thread(
+                target=self._run_live_worker,
+                args=(self._live_stamp(), patch, changed),
+                daemon=True,
+            )
+            self.status_var.set("Live transliteration running…")
+            self._live_thread.start()
+            return
+
+        try:
+            converted = [self._live_convert(line, direction, ascii_only) for line in changed]
+        except Exception:
+            self.status_var.set("Live transliteration failed")
+            return
+        self._live_patch(patch, converted)
+
+    def _live_stamp(self) -> tuple[int, str, bool, tuple[str, bool] | None]:
+        # Identifies the input, options and output state a patch was made for.
+        return (
+            self._live_generation,
+            self.direction_var.get(),
+            bool(self.ascii_var.get()),
+            self._live_options,
+        )
+
+    def _run_live_worker(
+        self,
+        stamp: tuple[int, str, bool, tuple[str, bool] | None],
+        patch: tuple[list[str], int, int, bool, tuple[str, bool]],
+        changed: list[str],
+    ) -> None:
+        direction, ascii_only = patch[4]
+        try:
+            converted = [
+                self._convert(line, direction, ascii_only) if line else line
+                for line in changed
+            ]
+        except Exception:
+            self._post(self._on_live_converted, stamp, patch, None)
+            return
+        self._post(self._on_live_converted, stamp, patch, converted)
+
+    def _on_live_converted(
+        self,
+        stamp: tuple[int, str, bool, tuple[str, bool] | None],
+        patch: tuple[list[str], int, int, bool, tuple[str, bool]],
+        converted: list[str] | None,
+    ) -> None:
+        self._live_thread = None
+        if converted is None:
+            self.status_var.set("Live transliteration failed")
+            return
+        # The patch is only valid if neither the input nor the output has
+        # changed since the conversion started; otherwise start over.
+        if stamp != self._live_stamp():
+            self._schedule_live_update()
+            return
+        self._live_patch(patch, converted)
+        self.status_var.set("Done")
+
+    def _live_patch(
+        self,
+        patch: tuple[list[str], int, int, bool, tuple[str, bool]],
+        converted: list[str],
+    ) -> None:
+        lines, start, old_end, has_suffix, options = patch
+        self.output_text.configure(state="normal")
+        if has_suffix:
+            self.output_text.delete(f"{start + 1}.0", f"{old_end + 1}.0")
+            self.output_text.insert(
+                f"{start + 1}.0", "".join(line + "\n" for line in converted)
+            )
+        elif start:
+            self.output_text.delete(f"{start}.end", "end-1c")
+            self.output_text.insert(
+                f"{start}.end", "".join("\n" + line for line in converted)
+            )
+        else:
+            self.output_text.delete("1.0", "end-1c")
+            self.output_text.insert("1.0", "\n".join(converted))
+        self._update_output_state()
+
+        self._live_lines = lines
+        self._live_options = options
 
     def _transliterate(self) -> None:
         source = self._get_input()
@@ -216,21 +483,243 @@ class RussianNatoTransliteratorGUIEn:
         direction = self.direction_var.get()
         ascii_only = bool(self.ascii_var.get())
 
+        self._job_id += 1
+        self._cancel_event = threading.Event()
+        self._worker = threading.Thread(
+            target=self._run_worker,
+            args=(self._job_id, self._cancel_event, source, direction, ascii_only),
+            daemon=True,
+        )
+        self._set_busy(True)
+        if direction == "auto":
+            # transliterate_auto needs the whole text in one call, so there is
+            # no progress to report.
+            self.progress.configure(mode="indeterminate")
+            self.progress.start()
+            self.status_var.set("Transliterating…")
+        else:
+            self._on_worker_progress(self._job_id, 0)
+        self._worker.start()
+
+    def _cancel_transliteration(self) -> None:
+        # The running job is abandoned right away: the worker stops at the
+        # next block, and a result it still delivers is discarded.
+        self._cancel_event.set()
+        self._on_worker_cancelled(self._job_id)
+        self._job_id += 1
+
+    def _set_busy(self, busy: bool) -> None:
+        self.progress.stop()
+        self.progress.configure(mode="determinate")
+        if busy:
+            self.progress["value"] = 0
+            self.transliterate_button.state(["disabled"])
+            self.convert_file_button.state(["disabled"])
+            self.cancel_button.state(["!disabled"])
+        else:
+            self.transliterate_button.state(["!disabled"])
+            self.convert_file_button.state(["!disabled"])
+            self.cancel_button.state(["disabled"])
+
+    @staticmethod
+    def _convert(text: str, direction: str, ascii_only: bool) -> str:
+        if direction == "ru2lat":
+            return transliterate_ru_to_bgn(text, ascii_only=ascii_only)
+        if direction == "lat2ru":
+            return transliterate_bgn_to_ru(text)
+        return transliterate_auto(text, ascii_only=ascii_only)
+
+    @staticmethod
+    def _split_blocks(text: str, direction: str) -> list[str]:
+        # Auto mode detects the direction from the whole text, so it must not
+        # be split; otherwise each block could be detected differently.
+        if direction == "auto":
+            return [text]
+        blocks: list[str] = []
+        current: list[str] = []
+        size = 0
+        for line in text.splitlines(keepends=True):
+            current.append(line)
+            size += len(line)
+            if size >= WORKER_BLOCK_CHARS:
+                blocks.append("".join(current))
+                current = []
+                size = 0
+        if current:
+            blocks.append("".join(current))
+        return blocks
+
+    def _post(self, callback: Callable[..., None], *args: object) -> None:
+        # Hands a result from the worker thread back to the Tk main loop.
         try:
-            if direction == "ru2lat":
-                converted = transliterate_ru_to_bgn(source, ascii_only=ascii_only)
-            elif direction == "lat2ru":
-                converted = transliterate_bgn_to_ru(source)
-            else:
-                converted = transliterate_auto(source, ascii_only=ascii_only)
+            self.root.after(0, callback, *args)
+        except (RuntimeError, tk.TclError):
+            # The window was closed while the worker was still running.
+            pass
+
+    def _run_worker(
+        self,
+        job_id: int,
+        cancel_event: threading.Event,
+        source: str,
+        direction: str,
+        ascii_only: bool,
+    ) -> None:
+        total = len(source)
+        done = 0
+        parts: list[str] = []
+        try:
+            for block in self._split_blocks(source, direction):
+                if cancel_event.is_set():
+                    self._post(self._on_worker_cancelled, job_id)
+                    return
+                parts.append(self._convert(block, direction, ascii_only))
+                done += len(block)
+                if direction != "auto":
+                    self._post(self._on_worker_progress, job_id, done * 100 // total)
         except Exception as exc:
-            messagebox.showerror("Error", f"Transliteration failed:\n{exc}")
-            self.status_var.set("Failed")
+            self._post(self._on_worker_failed, job_id, exc)
+            return
+        if cancel_event.is_set():
+            self._post(self._on_worker_cancelled, job_id)
             return
+        self._post(self._on_worker_done, job_id, "".join(parts))
 
+    def _on_worker_progress(self, job_id: int, percent: int) -> None:
+        if job_id == self._job_id:
+            self.progress["value"] = percent
+            self.status_var.set(f"Transliterating… {percent}%")
+
+    def _on_worker_done(self, job_id: int, converted: str) -> None:
+        if job_id != self._job_id:
+            return
+        self._set_busy(False)
         self._set_output(converted)
         self.status_var.set("Done")
 
+    def _on_worker_failed(self, job_id: int, exc: Exception) -> None:
+        if job_id != self._job_id:
+            return
+        self._set_busy(False)
+        self.progress["value"] = 0
+        messagebox.showerror("Error", f"Transliteration failed:\n{exc}")
+        self.status_var.set("Failed")
+
+    def _on_worker_cancelled(self, job_id: int) -> None:
+        if job_id != self._job_id:
+            return
+        self._set_busy(False)
+        self.progress["value"] = 0
+        self.status_var.set("Cancelled")
+
+    def _convert_file(self) -> None:
+        in_path = filedialog.askopenfilename(
+            title="Choose input file",
+            filetypes=[("Text files", "*.txt"), ("All files", "*.*")],
+        )
+        if not in_path:
+            return
+        out_path = filedialog.asksaveasfilename(
+            title="Choose output file",
+            defaultextension=".txt",
+            filetypes=[("Text files", "*.txt"), ("All files", "*.*")],
+        )
+        if not out_path:
+            return
+
+        self._set_output("")
+        self.input_text.delete("1.0", tk.END)
+        self.input_text.insert("1.0", self._read_preview(in_path))
+
+        direction = self.direction_var.get()
+        ascii_only = bool(self.ascii_var.get())
+
+        self._job_id += 1
+        self._cancel_event = threading.Event()
+        self._worker = threading.Thread(
+            target=self._run_file_worker,
+            args=(self._job_id, self._cancel_event, in_path, out_path, direction, ascii_only),
+            daemon=True,
+        )
+        self._set_busy(True)
+        self._on_file_progress(self._job_id, 0, 0.0)
+        self._worker.start()
+
+    def _run_file_worker(
+        self,
+        job_id: int,
+        cancel_event: threading.Event,
+        in_path: str,
+        out_path: str,
+        direction: str,
+        ascii_only: bool,
+    ) -> None:
+        # The result is written next to the target and only moved into place
+        # once complete, so a cancelled run never clobbers an existing file.
+        # A file cannot be held in memory as a whole, so in auto mode the
+        # direction is detected for each block separately.
+        part_path = out_path + ".part"
+        started = time.perf_counter()
+        rate = 0.0
+        try:
+            total = os.path.getsize(in_path) or 1
+            with open(in_path, "r", encoding="utf-8") as src, open(
+                part_path, "w", encoding="utf-8"
+            ) as dst:
+                for block in iter_line_blocks(src):
+                    if cancel_event.is_set():
+                        break
+                    dst.write(self._convert(block, direction, ascii_only))
+                    done = src.buffer.tell()
+                    rate = done / 1e6 / max(time.perf_counter() - started, 1e-9)
+                    percent = min(100, done * 100 // total)
+                    self._post(self._on_file_progress, job_id, percent, rate)
+            if cancel_event.is_set():
+                os.remove(part_path)
+                self._post(self._on_worker_cancelled, job_id)
+                return
+            os.replace(part_path, out_path)
+        except Exception as exc:
+            if os.path.exists(part_path):
+                os.remove(part_path)
+            self._post(self._on_file_failed, job_id, exc)
+            return
+        self._post(self._on_file_done, job_id, out_path, rate)
+
+    def _on_file_progress(self, job_id: int, percent: int, rate: float) -> None:
+        if job_id == self._job_id:
+            self.progress["value"] = percent
+            self.status_var.set(f"Converting file… {percent}% ({rate:.1f} MB/s)")
+
+    def _on_file_done(self, job_id: int, out_path: str, rate: float) -> None:
+        if job_id != self._job_id:
+            return
+        self._set_busy(False)
+        self._set_output(self._read_preview(out_path))
+        self.status_var.set(
+            f"File converted ({rate:.1f} MB/s), "
+            f"preview: first {PREVIEW_BYTES // 1024} KB"
+        )
+
+    @staticmethod
+    def _read_preview(path: str) -> str:
+        try:
+            with open(path, "rb") as f:
+                data = f.read(PREVIEW_BYTES)
+            # Without final=True a character cut off at the end is dropped.
+            return codecs.getincrementaldecoder("utf-8")().decode(data)
+        except (OSError, UnicodeDecodeError):
+            # The worker reports unreadable input; the preview just stays empty.
+            return ""
+
+    def _on_file_failed(self, job_id: int, exc: Exception) -> None:
+        if job_id != self._job_id:
+            return
+        self._set_busy(False)
+        self.progress["value"] = 0
+        messagebox.showerror("Error", f"Could not convert file:\n{exc}")
+        self.status_var.set("Error")
+
     def _swap_texts(self) -> None:
         source = self._get_input()
         target = self.output_text.get("1.0", tk.END).rstrip("\n")
@@ -247,7 +736,7 @@ class RussianNatoTransliteratorGUIEn:
 
     def _clear_texts(self) -> None:
         self.input_text.delete("1.0", tk.END)
-        self.output_text.delete("1.0", tk.END)
+        self._set_output("")
         self.status_var.set("Cleared")
 
     def _load_input_file(self) -> None:
@@ -257,19 +746,53 @@ class RussianNatoTransliteratorGUIEn:
         )
         if not path:
             return
+        # The file replaces the input piece by piece. If reading fails
+        # partway, the previous text is put back when it is small; otherwise
+        # the input is left empty. Undo is off during the load so the undo
+        # stack does not keep another copy of either text.
+        size = (self.input_text.count("1.0", "end-1c") or (0,))[0]
+        previous = ""
+        if size <= LOAD_RESTORE_MAX_CHARS:
+            previous = self.input_text.get("1.0", "end-1c")
+        live_off = False
+        cleared = False
+        self.input_text.configure(undo=False)
+        self.input_text.edit_reset()
         try:
             with open(path, "r", encoding="utf-8") as f:
-                content = f.read()
+                if self.live_var.get() and os.fstat(f.fileno()).st_size > LIVE_MAX_FILE_BYTES:
+                    live_off = True
+                    self.live_var.set(False)
+                    self._on_live_toggled()
+                self.input_text.delete("1.0", tk.END)
+                cleared = True
+                loaded = 0
+                while chunk := f.read(FILE_CHUNK_CHARS):
+                    self.input_text.insert("end-1c", chunk)
+                    loaded += len(chunk)
+                    self.status_var.set(f"Loading file… {loaded / 1e6:.1f} MB")
+                    self.root.update_idletasks()
         except Exception as exc:
+            if cleared:
+                self.input_text.delete("1.0", tk.END)
+                self.input_text.insert("1.0", previous)
+            if live_off:
+                self.live_var.set(True)
+                self._on_live_toggled()
             messagebox.showerror("Error", f"Could not read file:\n{exc}")
             return
-        self.input_text.delete("1.0", tk.END)
-        self.input_text.insert("1.0", content)
-        self.status_var.set("File loaded")
+        finally:
+            self.input_text.edit_reset()
+            self.input_text.configure(undo=True)
+        if live_off:
+            self.status_var.set("File loaded, live mode switched off for large file")
+        else:
+            self.status_var.set("File loaded")
 
     def _save_output_file(self) -> None:
-        output = self.output_text.get("1.0", tk.END).rstrip("\n")
-        if not output:
+        # Trailing line breaks are not saved, matching the text shown.
+        last = self.output_text.search(r"[^\n]", "end", backwards=True, regexp=True)
+        if not last:
             messagebox.showinfo("Info", "Output is empty.")
             return
 
@@ -281,8 +804,17 @@ class RussianNatoTransliteratorGUIEn:
         if not path:
             return
         try:
+            stop = self.output_text.index(f"{last}+1c")
             with open(path, "w", encoding="utf-8") as f:
-                f.write(output)
+                start = "1.0"
+                while self.output_text.compare(start, "<", stop):
+                    end = self.output_text.index(f"{start}+{FILE_CHUNK_CHARS}c")
+                    if self.output_text.compare(end, ">", stop):
+                        end = stop
+                    f.write(self.output_text.get(start, end))
+                    start = end
+                    self.status_var.set("Saving file…")
+                    self.root.update_idletasks()
         except Exception as exc:
             messagebox.showerror("Error", f"Could not save file:\n{exc}")
             return